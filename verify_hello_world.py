@@ -3,16 +3,23 @@
 Verification script to check hello_world.py output and timestamp validity.
 """
 
-import subprocess
+import os
 import re
+import subprocess
+import sys
 from datetime import datetime
 
+HELLO_WORLD_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hello_world.py')
+TIMESTAMP_RE = re.compile(r'Timestamp: (.+)')
+
 def verify_hello_world():
     """Run hello_world.py and verify its output."""
     try:
         # Run the hello_world.py script
-        result = subprocess.run(['python', 'hello_world.py'], 
-                              capture_output=True, text=True, cwd='/app/workspaces/cb0b7346-6c7d-4e2a-8eaf-38e41603327d')
+        started = datetime.now()
+        result = subprocess.run([sys.executable, HELLO_WORLD_SCRIPT],
+                              capture_output=True, text=True)
+        finished = datetime.now()
         
         if result.returncode != 0:
             print(f"❌ Script failed with return code {result.returncode}")
@@ -32,7 +39,7 @@ def verify_hello_world():
             return False
         
         timestamp_line = output_lines[1]
-        timestamp_match = re.match(r'Timestamp: (.+)', timestamp_line)
+        timestamp_match = TIMESTAMP_RE.match(timestamp_line)
         
         if not timestamp_match:
             print(f"❌ Timestamp line format incorrect: {timestamp_line}")
@@ -48,18 +55,20 @@ def verify_hello_world():
             print(f"Error: {e}")
             return False
         
-        # Check if timestamp is recent (within last minute)
-        current_time = datetime.now()
-        time_diff = (current_time - script_time).total_seconds()
-        
-        if abs(time_diff) > 60:  # More than 60 seconds difference
-            print(f"❌ Timestamp is not recent. Difference: {time_diff} seconds")
+        # Check the timestamp was taken while the script was running
+        if script_time < started:
+            time_diff = (started - script_time).total_seconds()
+            print(f"❌ Timestamp is before the script run. Difference: {time_diff} seconds")
+            return False
+        if script_time > finished:
+            time_diff = (script_time - finished).total_seconds()
+            print(f"❌ Timestamp is after the script run. Difference: {time_diff} seconds")
             return False
         
         print("✅ All checks passed!")
         print(f"✅ Output: 'Hello from Kortex'")
         print(f"✅ Timestamp: {timestamp_str}")
-        print(f"✅ Timestamp is recent (within last minute)")
+        print(f"✅ Timestamp falls within the script run")
         return True
         
     except Exception as e: